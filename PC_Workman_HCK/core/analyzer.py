@@ -1,27 +1,84 @@
 """core.analyzer
 Simple analyzer for detecting spikes and suspicious patterns.
+Streaming samples live in a fixed-size float32 ring buffer with a running
+sum, so spike checks are O(1) per sample and window stats use NumPy.
 """
 from import_core import register_component
-import statistics, time
+import time
+import numpy as np
+
+# one day of samples at 1 Hz
+DEFAULT_WINDOW = 86400
 
 class Analyzer:
-    def __init__(self):
+    def __init__(self, window=DEFAULT_WINDOW):
         register_component('core.analyzer', self)
+        # ring buffer of the last `window` pushed values
+        self._buf = np.zeros(window, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        # running sum of the values currently in the buffer
+        self._sum = 0.0
+
+    def push(self, value):
+        buf = self._buf
+        if self._count == buf.shape[0]:
+            # full: drop the oldest value (the one about to be overwritten)
+            self._sum -= float(buf[self._head])
+        else:
+            self._count += 1
+        buf[self._head] = value
+        # add the stored (float32) value so eviction subtracts exactly the same amount
+        self._sum += float(buf[self._head])
+        self._head = (self._head + 1) % buf.shape[0]
+
+    def window(self):
+        """Values currently in the window, oldest first (a copy)."""
+        if self._count < self._buf.shape[0]:
+            return self._buf[:self._count].copy()
+        return np.concatenate((self._buf[self._head:], self._buf[:self._head]))
 
-    def average(self, values):
+    def stddev(self):
+        if not self._count:
+            return 0
+        return round(float(np.std(self._buf[:self._count])), 2)
+
+    def average(self, values=None):
+        # without values: mean of the streaming window
+        if values is None:
+            return round(self._sum / self._count, 2) if self._count else 0
         if not values:
             return 0
-        return round(statistics.mean(values), 2)
+        return round(sum(values) / len(values), 2)
 
     def detect_spike(self, series, threshold_percent=30):
         # naive spike detection: compare last value to mean of previous values
         if len(series) < 2:
             return False, None
         last = series[-1]
-        prev_mean = statistics.mean(series[:-1]) if len(series) > 1 else series[0]
+        # mean of series[:-1] without copying the slice
+        prev_mean = (sum(series) - last) / (len(series) - 1)
         if prev_mean == 0:
             return False, None
         diff = ((last - prev_mean) / prev_mean) * 100
         return abs(diff) >= threshold_percent, round(diff, 2)
 
+    def detect_spike_value(self, value, threshold_percent=30):
+        """Streaming detect_spike: check one new sample against the window mean, then push it."""
+        value = float(value)  # also accepts NumPy scalars (e.g. from Monitor.read_into)
+        if self._count == 0:
+            self.push(value)
+            return False, None
+        prev_mean = self._sum / self._count
+        self.push(value)
+        if prev_mean == 0:
+            return False, None
+        diff = ((value - prev_mean) / prev_mean) * 100
+        return abs(diff) >= threshold_percent, round(diff, 2)
+
+    def reset(self):
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+
 analyzer = Analyzer()
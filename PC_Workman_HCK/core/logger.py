@@ -1,38 +1,103 @@
 """core.logger
 Writes hourly snapshots and aggregation helpers.
+Rows are appended as packed binary records (see HOURLY_DTYPE). The hourly
+path writes each row at once; high-rate sampling can pass a larger batch_size
+to buffer rows in memory (at most max_delay seconds, see Logger.flush). Use export_csv() for a
+human-readable copy. Rows from the old hourly_usage.csv log are migrated into
+the binary file the first time it is created; the CSV itself is left untouched.
 """
 from import_core import COMPONENTS, register_component
-import os, csv, time, json
+import os, csv, time, json, atexit, struct
 from datetime import datetime
+import numpy as np
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'logs')
 os.makedirs(DATA_DIR, exist_ok=True)
 
-HOURLY_CSV = os.path.join(DATA_DIR, 'hourly_usage.csv')
+HOURLY_BIN = os.path.join(DATA_DIR, 'hourly_usage.bin')
+HOURLY_CSV = os.path.join(DATA_DIR, 'hourly_usage.csv')  # legacy text log (read-only now)
+HOURLY_EXPORT_CSV = os.path.join(DATA_DIR, 'hourly_usage_export.csv')
+
+# one 20-byte little-endian record per snapshot: timestamp + cpu/gpu/ram percent
+RECORD = struct.Struct('<Q3f')
+HOURLY_DTYPE = np.dtype([('timestamp', '<u8'), ('cpu_percent', '<f4'), ('gpu_percent', '<f4'), ('ram_percent', '<f4')])
 
 HEADER = ['timestamp', 'iso_time', 'cpu_percent', 'gpu_percent', 'ram_percent']
 
+def load_hourly(path=HOURLY_BIN):
+    """Map the hourly records as a read-only structured array (no parsing, no copy)."""
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=HOURLY_DTYPE)
+    # ignore a trailing partial record (e.g. after a crash mid-write)
+    n = os.path.getsize(path) // HOURLY_DTYPE.itemsize
+    if n == 0:
+        return np.zeros(0, dtype=HOURLY_DTYPE)
+    return np.memmap(path, dtype=HOURLY_DTYPE, mode='r', shape=(n,))
+
+def migrate_csv(csv_path=HOURLY_CSV, bin_path=HOURLY_BIN):
+    """Copy rows of the legacy CSV log into a new binary log; returns the row count."""
+    if os.path.exists(bin_path) or not os.path.exists(csv_path):
+        return 0
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        records = [RECORD.pack(int(float(row['timestamp'])), float(row['cpu_percent']),
+                               float(row['gpu_percent']), float(row['ram_percent']))
+                   for row in csv.DictReader(f)]
+    if records:
+        with open(bin_path, 'wb') as f:
+            f.write(b''.join(records))
+    return len(records)
+
 class Logger:
-    def __init__(self):
+    def __init__(self, batch_size=1, max_delay=60.0):
         register_component('core.logger', self)
-        # ensure file exists with header
-        if not os.path.exists(HOURLY_CSV):
-            with open(HOURLY_CSV, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(HEADER)
+        migrate_csv(HOURLY_CSV, HOURLY_BIN)
+        self.batch_size = batch_size
+        # pending rows are lost on a crash/kill (atexit doesn't run), so they are
+        # also flushed once the oldest has waited max_delay seconds
+        self.max_delay = max_delay
+        self._pending = []
+        self._pending_since = 0.0
+        # binary append handle, opened on first flush and kept for the process lifetime
+        self._fh = None
+        atexit.register(self.close)
 
     def write_hourly(self, snapshot):
-        iso = datetime.utcfromtimestamp(snapshot['timestamp']).isoformat()
-        row = [snapshot['timestamp'], iso, snapshot['cpu_percent'], snapshot['gpu_percent'], snapshot['ram_percent']]
-        with open(HOURLY_CSV, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
+        record = RECORD.pack(int(snapshot['timestamp']), snapshot['cpu_percent'], snapshot['gpu_percent'], snapshot['ram_percent'])
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._pending_since >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        """Write all pending records with a single write + flush."""
+        if not self._pending:
+            return
+        if self._fh is None:
+            self._fh = open(HOURLY_BIN, 'ab', buffering=1 << 16)
+        self._fh.write(b''.join(self._pending))
+        self._fh.flush()
+        self._pending.clear()
+
+    def close(self):
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def read_hourly(self):
-        if not os.path.exists(HOURLY_CSV):
-            return []
-        with open(HOURLY_CSV, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        # make buffered rows visible to readers
+        self.flush()
+        return load_hourly(HOURLY_BIN)
+
+    def export_csv(self, path=HOURLY_EXPORT_CSV):
+        """Write all hourly records to a CSV (with iso_time) for humans/spreadsheets."""
+        records = self.read_hourly()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            for ts, cpu, gpu, ram in records.tolist():
+                writer.writerow([ts, datetime.utcfromtimestamp(ts).isoformat(), round(cpu, 2), round(gpu, 2), round(ram, 2)])
+        return path
 
 logger = Logger()
@@ -9,21 +9,49 @@ class Monitor:
     """Mock Monitor class. Use `read()` to get current usage snapshot."""
     def __init__(self):
         self.name = "Monitor"
+        # snapshot template, updated in place on every read (no per-sample dict/list churn)
+        self._procs = [
+            {'pid': 1001, 'name': 'GTA5.exe', 'cpu': 0.0, 'ram': 0.0},
+            {'pid': 2002, 'name': 'chrome.exe', 'cpu': 0.0, 'ram': 0.0},
+        ]
+        self._snap = {
+            'timestamp': 0,
+            'cpu_percent': 0.0,
+            'gpu_percent': 0.0,
+            'ram_percent': 0.0,
+            'processes': self._procs,
+        }
         register_component('core.monitor', self)
 
     def read(self):
+        """Return the current snapshot.
+
+        The result is a shallow copy of a reused template: top-level fields are
+        safe to keep, but the 'processes' entries are updated by the next read.
+        """
         # Mock data: replace with psutil in production
-        snapshot = {
-            'timestamp': int(time.time()),
-            'cpu_percent': round(random.uniform(1, 95), 2),
-            'gpu_percent': round(random.uniform(0, 90), 2),
-            'ram_percent': round(random.uniform(5, 95), 2),
-            'processes': [
-                {'pid': 1001, 'name': 'GTA5.exe', 'cpu': round(random.uniform(0,30),2), 'ram': round(random.uniform(0,10),2)},
-                {'pid': 2002, 'name': 'chrome.exe', 'cpu': round(random.uniform(0,25),2), 'ram': round(random.uniform(1,15),2)},
-            ]
-        }
-        return snapshot
+        snap = self._snap
+        snap['timestamp'] = int(time.time())
+        snap['cpu_percent'] = round(random.uniform(1, 95), 2)
+        snap['gpu_percent'] = round(random.uniform(0, 90), 2)
+        snap['ram_percent'] = round(random.uniform(5, 95), 2)
+        gta, chrome = self._procs
+        gta['cpu'] = round(random.uniform(0,30),2)
+        gta['ram'] = round(random.uniform(0,10),2)
+        chrome['cpu'] = round(random.uniform(0,25),2)
+        chrome['ram'] = round(random.uniform(1,15),2)
+        return dict(snap)
+
+    def read_into(self, out):
+        """Write [cpu, gpu, ram] percent into `out` (e.g. a preallocated 3-element array).
+
+        Allocation-free alternative to read() for callers that only need the usage floats.
+        """
+        # Mock data: replace with psutil in production
+        out[0] = round(random.uniform(1, 95), 2)
+        out[1] = round(random.uniform(0, 90), 2)
+        out[2] = round(random.uniform(5, 95), 2)
+        return out
 
 # convenience instance
 monitor = Monitor()
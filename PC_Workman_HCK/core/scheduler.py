@@ -1,5 +1,6 @@
 """core.scheduler
 Simple scheduler that triggers hourly writes. In production use APScheduler or system scheduler.
+Ticks are scheduled against a monotonic deadline, and stop() wakes the loop immediately.
 """
 import time, threading
 from import_core import register_component, COMPONENTS
@@ -7,20 +8,35 @@ from import_core import register_component, COMPONENTS
 class Scheduler:
     def __init__(self, interval_seconds=3600):
         self.interval = interval_seconds
-        self._stop = False
+        self._stop_event = threading.Event()
+        self._thread = None
         register_component('core.scheduler', self)
 
     def start_loop(self):
-        t = threading.Thread(target=self._loop, daemon=True)
-        t.start()
-        return t
+        if self._thread is not None and self._thread.is_alive():
+            if not self._stop_event.is_set():
+                # already running: hand back the existing thread
+                return self._thread
+            # stop() was called but the loop hasn't exited yet; it wakes on the
+            # event, so this join returns at once
+            self._thread.join()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self._thread
 
     def _loop(self):
-        while not self._stop:
-            # In a real run you'd collect from monitor and call logger.write_hourly
-            time.sleep(self.interval)
+        # fixed deadlines (not sleep(interval) after the work) so ticks don't drift
+        next_fire = time.monotonic() + self.interval
+        while not self._stop_event.wait(max(0, next_fire - time.monotonic())):
+            self._tick()
+            next_fire += self.interval
+
+    def _tick(self):
+        # In a real run you'd collect from monitor and call logger.write_hourly
+        pass
 
     def stop(self):
-        self._stop = True
+        self._stop_event.set()
 
 scheduler = Scheduler(interval_seconds=3600)
@@ -1,30 +1,29 @@
 """hck_stats_engine.avg_calculator
 Utilities to compute hourly -> daily -> weekly aggregations.
 """
-from import_core import register_component
-import csv, os, statistics
+from import_core import COMPONENTS, register_component
+import core.logger as core_logger
 from datetime import datetime
-
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'logs')
-HOURLY = os.path.join(DATA_DIR, 'hourly_usage.csv')
+import numpy as np
 
 class AvgCalculator:
     def __init__(self):
         register_component('hck_stats_engine.avg_calculator', self)
 
     def hourly_to_daily(self):
-        # naive implementation: group by date
-        if not os.path.exists(HOURLY):
+        # group by UTC date
+        # read through the registered logger (same file, includes rows it still buffers)
+        logger = COMPONENTS.get('core.logger')
+        records = logger.read_hourly() if logger is not None else core_logger.load_hourly(core_logger.HOURLY_BIN)
+        if len(records) == 0:
             return []
+        days, inverse = np.unique(records['timestamp'] // 86400, return_inverse=True)
+        sums = np.bincount(inverse, weights=records['cpu_percent'])
+        counts = np.bincount(inverse)
         rows = []
-        with open(HOURLY, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            day_buckets = {}
-            for r in reader:
-                date = r['iso_time'][:10]
-                day_buckets.setdefault(date, []).append(float(r['cpu_percent']))
-            for date, vals in day_buckets.items():
-                rows.append({'date': date, 'cpu_avg': round(statistics.mean(vals),2)})
+        for day, total, n in zip(days.tolist(), sums.tolist(), counts.tolist()):
+            date = datetime.utcfromtimestamp(day * 86400).date().isoformat()
+            rows.append({'date': date, 'cpu_avg': round(total / n, 2)})
         return rows
 
 avg_calc = AvgCalculator()
@@ -1,8 +1,45 @@
 """import_core
 Central registry for components. All modules register here using register_component.
-This helps decoupling and allows startup.py to import modules and access them via COMPONENTS.
+This helps decoupling: components are imported lazily, the first time
+COMPONENTS.get(name) / COMPONENTS[name] asks for one that isn't registered yet.
 """ 
-COMPONENTS = {}
+import importlib
+
+# component name -> module that registers it on import
+_LAZY = {
+    'core.monitor': 'core.monitor',
+    'core.logger': 'core.logger',
+    'core.analyzer': 'core.analyzer',
+    'core.scheduler': 'core.scheduler',
+    'ai.hck_gpt': 'ai.hck_gpt',
+    'ai.ai_logic': 'ai.ai_logic',
+    'ai.detector': 'ai.detector',
+    'hck_stats_engine.avg_calculator': 'hck_stats_engine.avg_calculator',
+    'hck_stats_engine.trend_analysis': 'hck_stats_engine.trend_analysis',
+    'hck_stats_engine.time_utils': 'hck_stats_engine.time_utils',
+    'ui.dialogs': 'ui.dialogs',
+    'ui.charts': 'ui.charts',
+}
+
+class _Registry(dict):
+    """dict of registered components that imports known ones on first lookup."""
+    def _load(self, name):
+        module = _LAZY.get(name)
+        if module is not None:
+            importlib.import_module(module)  # module calls register_component itself
+
+    def get(self, name, default=None):
+        if name not in self:
+            self._load(name)
+        return dict.get(self, name, default)
+
+    def __missing__(self, name):
+        self._load(name)
+        if name in self:
+            return dict.__getitem__(self, name)
+        raise KeyError(name)
+
+COMPONENTS = _Registry()
 def register_component(name, obj):
     COMPONENTS[name] = obj
     return obj
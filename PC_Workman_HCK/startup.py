@@ -1,23 +1,27 @@
 """startup.py
 Entry point for PC Workman skeleton. Initializes components and runs a demo UI.
+Components are loaded on demand through COMPONENTS (see import_core), so
+`python startup.py --headless` never imports the UI/tkinter.
 """
+import importlib, sys
 from import_core import COMPONENTS
-# import to register components
-import core.monitor, core.logger, core.analyzer, core.scheduler
-import ai.hck_gpt, ai.ai_logic, ai.detector
-import hck_stats_engine.avg_calculator, hck_stats_engine.trend_analysis
-import ui.main_window
 
-def run_demo():
+def run_demo(headless=False):
     print('Starting PC Workman demo (skeleton)...')
     # start scheduler loop in background
+    thread = None
     try:
-        COMPONENTS.get('core.scheduler').start_loop()
+        thread = COMPONENTS.get('core.scheduler').start_loop()
     except Exception:
         pass
+    if headless:
+        # scheduler only: keep the process alive for its loop
+        if thread is not None:
+            thread.join()
+        return
     # UI demo
-    ui = ui.main_window.MainWindow()
+    ui = importlib.import_module('ui.main_window').MainWindow()
     ui.run()
 
 if __name__ == '__main__':
-    run_demo()
+    run_demo(headless='--headless' in sys.argv[1:])
@@ -1,7 +1,34 @@
 """tests.test_analyzer
 """
-from core.analyzer import analyzer
+import numpy as np
+from import_core import COMPONENTS
+from core.analyzer import Analyzer, analyzer
 
 def test_detect_spike_returns_tuple():
     ok, diff = analyzer.detect_spike([10,12,30], threshold_percent=50)
     assert isinstance(ok, bool)
+
+def test_detect_spike_streaming_matches_list(monkeypatch):
+    monkeypatch.setitem(COMPONENTS, 'core.analyzer', analyzer)
+    a = Analyzer()
+    series = [10, 12, 30]
+    for v in series[:-1]:
+        a.push(v)
+    assert a.detect_spike_value(series[-1], threshold_percent=50) == analyzer.detect_spike(series, threshold_percent=50)
+    assert a.average() == round(sum(series) / len(series), 2)
+
+def test_window_keeps_latest_values(monkeypatch):
+    monkeypatch.setitem(COMPONENTS, 'core.analyzer', analyzer)
+    a = Analyzer(window=3)
+    for v in [1, 2, 3, 4, 5]:
+        a.push(v)
+    assert list(a.window()) == [3, 4, 5]
+    assert a.average() == 4
+
+def test_detect_spike_value_accepts_numpy_scalars(monkeypatch):
+    monkeypatch.setitem(COMPONENTS, 'core.analyzer', analyzer)
+    a = Analyzer(window=4)
+    buf = np.array([10, 10, 20], dtype=np.float32)
+    a.push(buf[0])
+    a.push(np.int64(10))
+    assert a.detect_spike_value(buf[2], threshold_percent=50) == (True, 100.0)
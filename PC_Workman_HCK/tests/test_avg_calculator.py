@@ -1,7 +1,20 @@
 """tests.test_avg_calculator
 """
+from import_core import COMPONENTS
+import core.logger as logger_mod
 from hck_stats_engine.avg_calculator import avg_calc
 
 def test_hourly_to_daily_runs():
     # Should not raise
     _ = avg_calc.hourly_to_daily()
+
+def test_hourly_to_daily_reads_the_logger_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(logger_mod, 'HOURLY_BIN', str(tmp_path / 'hourly.bin'))
+    monkeypatch.setattr(logger_mod, 'HOURLY_CSV', str(tmp_path / 'missing.csv'))
+    monkeypatch.setitem(COMPONENTS, 'core.logger', COMPONENTS['core.logger'])
+    log = logger_mod.Logger(batch_size=10)  # rows stay buffered until read
+    for ts, cpu in [(0, 10.0), (3600, 30.0), (86400, 50.0)]:
+        log.write_hourly({'timestamp': ts, 'cpu_percent': cpu, 'gpu_percent': 0.0, 'ram_percent': 0.0})
+    assert avg_calc.hourly_to_daily() == [{'date': '1970-01-01', 'cpu_avg': 20.0},
+                                          {'date': '1970-01-02', 'cpu_avg': 50.0}]
+    log.close()
@@ -0,0 +1,10 @@
+"""tests.test_import_core
+"""
+from import_core import COMPONENTS
+
+def test_components_load_on_lookup():
+    # ai.detector is not imported by any test module: looking it up loads it
+    detector = COMPONENTS.get('ai.detector')
+    assert detector is not None
+    assert COMPONENTS['ai.detector'] is detector
+    assert COMPONENTS.get('no.such.component') is None
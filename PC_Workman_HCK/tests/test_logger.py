@@ -0,0 +1,66 @@
+"""tests.test_logger
+"""
+from import_core import COMPONENTS
+import pytest
+import core.logger as logger_mod
+
+@pytest.fixture
+def log_paths(tmp_path, monkeypatch):
+    # keep Logger away from the real data/logs files: a fresh binary log and a
+    # missing legacy CSV (so nothing is migrated unless a test provides one)
+    monkeypatch.setattr(logger_mod, 'HOURLY_BIN', str(tmp_path / 'hourly.bin'))
+    monkeypatch.setattr(logger_mod, 'HOURLY_CSV', str(tmp_path / 'missing.csv'))
+    # Logger() re-registers itself; restore the module-level instance afterwards
+    monkeypatch.setitem(COMPONENTS, 'core.logger', COMPONENTS['core.logger'])
+    return tmp_path
+
+def test_write_hourly_flushes_in_batches(log_paths):
+    log = logger_mod.Logger(batch_size=2)
+    snap = {'timestamp': 0, 'cpu_percent': 1.0, 'gpu_percent': 2.0, 'ram_percent': 3.0}
+    log.write_hourly(snap)
+    assert len(logger_mod.load_hourly(logger_mod.HOURLY_BIN)) == 0  # still pending
+    log.write_hourly(snap)
+    records = logger_mod.load_hourly(logger_mod.HOURLY_BIN)
+    assert len(records) == 2
+    assert records['cpu_percent'][1] == 1.0
+    log.close()
+
+def test_float_timestamp_is_truncated(log_paths):
+    log = logger_mod.Logger(batch_size=1)
+    log.write_hourly({'timestamp': 1700000000.75, 'cpu_percent': 1.0, 'gpu_percent': 2.0, 'ram_percent': 3.0})
+    assert logger_mod.load_hourly(logger_mod.HOURLY_BIN)['timestamp'][0] == 1700000000
+    log.close()
+
+def test_legacy_csv_is_migrated_once_and_kept(log_paths, tmp_path, monkeypatch):
+    legacy = tmp_path / 'hourly.csv'
+    legacy.write_text('timestamp,iso_time,cpu_percent,gpu_percent,ram_percent\n'
+                      '3600,1970-01-01T01:00:00,10.0,20.0,30.0\n', encoding='utf-8')
+    original = legacy.read_text(encoding='utf-8')
+    monkeypatch.setattr(logger_mod, 'HOURLY_CSV', str(legacy))
+    log = logger_mod.Logger(batch_size=1)
+    log.write_hourly({'timestamp': 7200, 'cpu_percent': 1.0, 'gpu_percent': 2.0, 'ram_percent': 3.0})
+    assert logger_mod.load_hourly(logger_mod.HOURLY_BIN)['timestamp'].tolist() == [3600, 7200]
+    # a second Logger must not migrate again
+    logger_mod.Logger(batch_size=1).close()
+    assert len(logger_mod.load_hourly(logger_mod.HOURLY_BIN)) == 2
+    log.export_csv(str(tmp_path / 'export.csv'))
+    assert legacy.read_text(encoding='utf-8') == original
+    log.close()
+
+def test_default_logger_writes_each_row(log_paths):
+    log = logger_mod.Logger()
+    log.write_hourly({'timestamp': 0, 'cpu_percent': 1.0, 'gpu_percent': 2.0, 'ram_percent': 3.0})
+    assert len(logger_mod.load_hourly(logger_mod.HOURLY_BIN)) == 1
+    log.close()
+
+def test_large_batch_still_flushes_after_max_delay(log_paths, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(logger_mod.time, 'monotonic', lambda: clock[0])
+    log = logger_mod.Logger(batch_size=1000, max_delay=5.0)
+    snap = {'timestamp': 0, 'cpu_percent': 1.0, 'gpu_percent': 2.0, 'ram_percent': 3.0}
+    log.write_hourly(snap)
+    assert len(logger_mod.load_hourly(logger_mod.HOURLY_BIN)) == 0
+    clock[0] += 5.0
+    log.write_hourly(snap)
+    assert len(logger_mod.load_hourly(logger_mod.HOURLY_BIN)) == 2
+    log.close()
@@ -5,3 +5,8 @@ from core.monitor import monitor
 def test_monitor_has_read():
     s = monitor.read()
     assert 'cpu_percent' in s
+
+def test_monitor_read_into_fills_buffer():
+    buf = [0.0, 0.0, 0.0]
+    assert monitor.read_into(buf) is buf
+    assert all(0 <= v <= 100 for v in buf)
@@ -0,0 +1,26 @@
+"""tests.test_scheduler
+"""
+from import_core import COMPONENTS
+from core.scheduler import Scheduler, scheduler
+
+def test_stop_wakes_loop_immediately(monkeypatch):
+    monkeypatch.setitem(COMPONENTS, 'core.scheduler', scheduler)
+    s = Scheduler(interval_seconds=3600)
+    t = s.start_loop()
+    assert s.start_loop() is t
+    s.stop()
+    t.join(timeout=1)
+    assert not t.is_alive()
+
+def test_restart_right_after_stop_starts_new_thread(monkeypatch):
+    monkeypatch.setitem(COMPONENTS, 'core.scheduler', scheduler)
+    s = Scheduler(interval_seconds=3600)
+    t = s.start_loop()
+    s.stop()
+    t2 = s.start_loop()
+    assert t2 is not t
+    assert not t.is_alive()
+    assert t2.is_alive()
+    s.stop()
+    t2.join(timeout=1)
+    assert not t2.is_alive()
@@ -4,35 +4,273 @@ Lightweight scalar autograd engine (micrograd-inspired).
 
 Core features:
 - Value: scalar value with .data, .grad, autograd history and backward propagation
-- Elementary ops: +, -, *, /, pow, exp, log, tanh, relu, sigmoid
-- Topological backward pass
+  (ValueFast: the same without the _op/label debug fields, for training)
+- Tensor: NumPy-backed array value with the same API (one graph node per array op)
+- Elementary ops: +, -, *, /, pow, exp, log, tanh, relu, sigmoid (+ @ for Tensor)
+- Topological backward pass (op-code dispatch, or optionally flattened into
+  arrays and run by a Numba kernel, see USE_NUMBA)
 - Small helpers for working with lists of Values (tensor_sum, tensor_mean)
 
 Design goals:
-- Pedagogical: easy to read, well-commented
-- Dependency-free (only stdlib: math, random)
+- Pedagogical: easy to read, well-commented (numba is optional)
+- Fast path: Tensor replaces thousands of scalar nodes with a single NumPy op
 - Safe numeric choices (small eps where needed)
 - Works well as an educational baseline for building tiny neural nets
 """
 
 from __future__ import annotations
-from typing import Callable, List, Set, Tuple, Iterable, Optional
+from typing import Callable, List, Tuple, Iterable, Optional
+from operator import attrgetter
 import math
 import random
 
-EPS = 1e-12  # small epsilon to improve numerical stability where needed
+import numpy as np
 
+EPS = 1e-12  # small epsilon to improve numerical stability where needed
 
-class Value:
+# Op codes: every op on Value records one of these in Value._op_code; the
+# backward pass dispatches on it (_BACKWARDS in Python, _run_backward in the
+# array kernel). OP_LEAF marks inputs/parameters (nothing to propagate).
+OP_LEAF = -1
+OP_ADD = 0
+OP_MUL = 1
+OP_POW = 2
+OP_EXP = 3
+OP_TANH = 4
+OP_RELU = 5
+OP_LOG = 6
+OP_NEG = 7
+OP_SIGMOID = 8
+OP_SUM = 9
+OP_XENT = 10  # fused softmax + cross-entropy (built by nn.softmax_cross_entropy)
+OP_DOT = 11   # fused w . x (+ b) of one Linear output (built by nn.Linear)
+OP_ADD_CONST = 12  # x + c with a Python number c kept in _const (no leaf node)
+OP_MUL_CONST = 13  # x * c, likewise
+
+# Opt-in: run Value.backward through the flattened arrays + Numba kernel.
+# Off by default because flattening the object graph is itself a Python loop
+# and costs more than the dispatch loop it replaces. It only wins when one
+# unchanged graph is backpropagated repeatedly via backward(topo_cache=...),
+# which flattens once; that is a benchmark pattern, since a training loop
+# rebuilds the graph every step. numba is imported on first use, not with engine.
+USE_NUMBA = False
+
+
+class ValueFast:
     """
-    Scalar value with autograd.
+    Scalar value with autograd (lean node: no debug fields).
 
     Attributes:
       data: float (the scalar value)
       grad: float (accumulated gradient, d(output)/d(this node))
-      _prev: set of parent Value nodes (inputs)
-      _op: string label of operation creating this Value (for debugging/visualization)
-      _backward: callable that populates parents' .grad from this node's .grad
+      _prev: tuple of parent nodes (inputs), in operand order
+      _op_code: OP_* code of the creating op; selects the backward rule
+      _const: op constant (pow exponent, numeric operand of +c / *c, xent target
+              index, dot length; 0.0 otherwise)
+
+    Gradients are propagated by module-level rules (_BACKWARDS[_op_code])
+    instead of a per-node closure, which keeps nodes small and cheap to build.
+
+    All ops live here; Value below adds the _op/label debug fields. Op
+    results are created as VALUE_CLASS (Value by default); set
+    engine.VALUE_CLASS = ValueFast to build smaller graphs when training.
+    """
+    __slots__ = ("data", "grad", "_prev", "_op_code", "_const")
+
+    def __init__(self, data: float, _children: Tuple['ValueFast', ...] = (), _op: str = '', label: str = ''):
+        # _op / label are accepted for signature compatibility with Value and dropped
+        self.data: float = float(data)
+        self.grad: float = 0.0
+        # kept as the tuple the op passed in (no copy, no hashing); duplicate
+        # operands (x + x) stay listed twice so each gets its gradient
+        self._prev: Tuple[ValueFast, ...] = _children
+        # set by each op to select its backward rule
+        self._op_code: int = OP_LEAF
+        self._const: float = 0.0
+
+    def __repr__(self):
+        return f"ValueFast(data={self.data:.6f}, grad={self.grad:.6f}, op_code={self._op_code})"
+
+    # -----------------------
+    # Utility / conversion
+    # -----------------------
+    @staticmethod
+    def _ensure_value(other) -> 'ValueFast':
+        return other if isinstance(other, ValueFast) else VALUE_CLASS(other)
+
+    def detach(self) -> 'ValueFast':
+        """Return a new node of the same class with same numeric data but no history."""
+        return type(self)(self.data)
+
+    def __float__(self):
+        return float(self.data)
+
+    # -----------------------
+    # Arithmetic operators
+    # -----------------------
+    # Python numbers on either side take a one-parent *_CONST op holding the
+    # number in _const, instead of being wrapped in a throwaway leaf Value.
+    def __add__(self, other):
+        if isinstance(other, (int, float)):
+            out = VALUE_CLASS(self.data + other, (self,), '+c')
+            out._op_code = OP_ADD_CONST
+            out._const = float(other)
+            return out
+        other = self._ensure_value(other)
+        out = VALUE_CLASS(self.data + other.data, (self, other), '+')
+        out._op_code = OP_ADD
+        return out
+
+    def __radd__(self, other):
+        return self + other
+
+    def __neg__(self):
+        out = VALUE_CLASS(-self.data, (self,), 'neg')
+        out._op_code = OP_NEG
+        return out
+
+    def __sub__(self, other):
+        if isinstance(other, (int, float)):
+            return self + (-other)
+        other = self._ensure_value(other)
+        return self + (-other)
+
+    def __rsub__(self, other):
+        if isinstance(other, (int, float)):
+            return (-self) + other
+        other = self._ensure_value(other)
+        return other - self
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            out = VALUE_CLASS(self.data * other, (self,), '*c')
+            out._op_code = OP_MUL_CONST
+            out._const = float(other)
+            return out
+        other = self._ensure_value(other)
+        out = VALUE_CLASS(self.data * other.data, (self, other), '*')
+        out._op_code = OP_MUL
+        return out
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)):
+            return self * (1.0 / other)
+        other = self._ensure_value(other)
+        # x / y = x * y^{-1}
+        return self * (other ** -1)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)):
+            return (self ** -1) * other
+        other = self._ensure_value(other)
+        return other / self
+
+    def __pow__(self, exponent):
+        assert isinstance(exponent, (int, float)), "Only constant powers supported for simplicity"
+        out = VALUE_CLASS(self.data ** exponent, (self,), f'**{exponent}')
+        out._op_code = OP_POW
+        out._const = float(exponent)
+        return out
+
+    # -----------------------
+    # Elementary math
+    # -----------------------
+    def exp(self):
+        out_data = math.exp(self.data)
+        out = VALUE_CLASS(out_data, (self,), 'exp')
+        out._op_code = OP_EXP
+        return out
+
+    def log(self):
+        # natural log with epsilon guard
+        safe = self.data if self.data > EPS else EPS
+        out = VALUE_CLASS(math.log(safe), (self,), 'log')
+        out._op_code = OP_LOG
+        return out
+
+    def tanh(self):
+        t = math.tanh(self.data)
+        out = VALUE_CLASS(t, (self,), 'tanh')
+        out._op_code = OP_TANH
+        return out
+
+    def relu(self):
+        out_data = self.data if self.data > 0 else 0.0
+        out = VALUE_CLASS(out_data, (self,), 'relu')
+        out._op_code = OP_RELU
+        return out
+
+    def sigmoid(self):
+        # single fused node (a composition would add neg/exp/add/pow/mul nodes)
+        x = self.data
+        if x >= 0:
+            s = 1.0 / (1.0 + math.exp(-x))
+        else:
+            # avoid overflow of exp(-x) for large negative x
+            e = math.exp(x)
+            s = e / (1.0 + e)
+        out = VALUE_CLASS(s, (self,), 'sigmoid')
+        out._op_code = OP_SIGMOID
+        return out
+
+    # -----------------------
+    # Backpropagation
+    # -----------------------
+    def topo(self) -> "Topo":
+        """Topological order of the graph ending at self (parents first, self last)."""
+        return Topo(_topo_order(self))
+
+    def backward(self, topo_cache: Optional[List["ValueFast"]] = None):
+        """
+        Run reverse-mode autodiff.
+
+        Builds topological order of the graph (iterative DFS) then applies each
+        node's backward rule (_BACKWARDS) in reverse.
+        After this call, every node's .grad contains d(self)/d(node) where self is the
+        original Value this method was called on.
+
+        topo_cache: order from self.topo() to skip the DFS when backpropagating
+        through the same graph again. Only valid while nothing has changed
+        since that graph's forward pass: the rules read every node's stored
+        .data, so after an optimizer step (or any leaf update) the
+        intermediate values are stale and the gradients wrong. Rebuild the
+        graph and take a fresh topo() instead. With USE_NUMBA the flattened
+        arrays are cached on it as well.
+        """
+        if topo_cache is None:
+            topo = _topo_order(self)
+        elif topo_cache and topo_cache[-1] is self:
+            topo = topo_cache
+        else:
+            raise ValueError("topo_cache was not built from this node (use node.topo())")
+
+        if USE_NUMBA:
+            kernel = _numba_kernel()
+            if kernel is not None:
+                _backward_arrays(topo, kernel)
+                return
+
+        # zero grads first (avoids accidental accumulation)
+        for node in topo:
+            node.grad = 0.0
+        self.grad = 1.0
+
+        backwards = _BACKWARDS
+        for node in reversed(topo):
+            if node._op_code != OP_LEAF:
+                backwards[node._op_code](node)
+
+
+class Value(ValueFast):
+    """
+    Scalar value with autograd, plus debug/visualization fields.
+
+    Attributes (in addition to ValueFast's):
+      _op: string label of operation creating this Value
+      label: optional user-facing name
 
     Usage:
       a = Value(2.0)
@@ -41,45 +279,403 @@ class Value:
       c.backward()
       # now a.grad, b.grad filled
     """
-    __slots__ = ("data", "grad", "_prev", "_op", "_backward", "label")
+    __slots__ = ("_op", "label")
 
-    def __init__(self, data: float, _children: Tuple['Value', ...] = (), _op: str = '', label: str = ''):
+    def __init__(self, data: float, _children: Tuple[ValueFast, ...] = (), _op: str = '', label: str = ''):
         self.data: float = float(data)
         self.grad: float = 0.0
-        self._prev: Set[Value] = set(_children)
+        self._prev: Tuple[ValueFast, ...] = _children
+        self._op_code: int = OP_LEAF
+        self._const: float = 0.0
         self._op: str = _op
-        # filled by each op to propagate gradients to parents
-        self._backward: Callable[[], None] = lambda: None
         self.label: str = label
 
     def __repr__(self):
         return f"Value(data={self.data:.6f}, grad={self.grad:.6f}, op={self._op})"
 
+
+# class used for the results of ops (and for constants wrapped by _ensure_value)
+VALUE_CLASS = Value
+
+
+def new_value(data: float, children: Tuple[ValueFast, ...], op: str) -> ValueFast:
+    """Create an op result node of the current VALUE_CLASS (for ops defined outside engine)."""
+    return VALUE_CLASS(data, children, op)
+
+
+# -----------------------
+# Backward rules (dispatch table indexed by OP_* code)
+# -----------------------
+def _add_backward(node: ValueFast):
+    # d/dx (x+y) = 1, d/dy (x+y) = 1
+    a, b = node._prev
+    a.grad += node.grad
+    b.grad += node.grad
+
+def _mul_backward(node: ValueFast):
+    # d/dx (x*y) = y, d/dy (x*y) = x
+    a, b = node._prev
+    a.grad += b.data * node.grad
+    b.grad += a.data * node.grad
+
+def _pow_backward(node: ValueFast):
+    (a,) = node._prev
+    exponent = node._const
+    # handle zero/near-zero numerics gracefully
+    if a.data == 0.0 and exponent - 1 < 0:
+        # avoid infinite gradient for 0 ** negative
+        return
+    a.grad += exponent * (a.data ** (exponent - 1)) * node.grad
+
+def _exp_backward(node: ValueFast):
+    # derivative of e^x is e^x (the node's own value)
+    (a,) = node._prev
+    a.grad += node.data * node.grad
+
+def _tanh_backward(node: ValueFast):
+    (a,) = node._prev
+    a.grad += (1.0 - node.data * node.data) * node.grad
+
+def _relu_backward(node: ValueFast):
+    (a,) = node._prev
+    if a.data > 0:
+        a.grad += node.grad
+
+def _log_backward(node: ValueFast):
+    (a,) = node._prev
+    a.grad += node.grad / (a.data if a.data > EPS else EPS)
+
+def _neg_backward(node: ValueFast):
+    (a,) = node._prev
+    a.grad -= node.grad
+
+def _sigmoid_backward(node: ValueFast):
+    # d/dx sigmoid(x) = s * (1 - s)
+    (a,) = node._prev
+    s = node.data
+    a.grad += s * (1.0 - s) * node.grad
+
+def _sum_backward(node: ValueFast):
+    # every input of an n-ary sum gets the full upstream gradient
+    g = node.grad
+    for a in node._prev:
+        a.grad += g
+
+def _xent_backward(node: ValueFast):
+    # d/dx_i [logsumexp(x) - x_t] = softmax(x)_i - [i == t]
+    logits = node._prev
+    target = int(node._const)
+    m = max(v.data for v in logits)
+    exps = [math.exp(v.data - m) for v in logits]
+    scale = node.grad / sum(exps)
+    for i, (v, e) in enumerate(zip(logits, exps)):
+        v.grad += e * scale - (node.grad if i == target else 0.0)
+
+def _dot_backward(node: ValueFast):
+    # parents are (w_0..w_{n-1}, x_0..x_{n-1}[, b]); d/dw_j = x_j, d/dx_j = w_j
+    prev = node._prev
+    n = int(node._const)
+    g = node.grad
+    for j in range(n):
+        w = prev[j]
+        x = prev[n + j]
+        w.grad += x.data * g
+        x.grad += w.data * g
+    if len(prev) > 2 * n:
+        prev[2 * n].grad += g
+
+def _add_const_backward(node: ValueFast):
+    (a,) = node._prev
+    a.grad += node.grad
+
+def _mul_const_backward(node: ValueFast):
+    (a,) = node._prev
+    a.grad += node._const * node.grad
+
+_BACKWARDS: List[Callable[[ValueFast], None]] = [
+    _add_backward,   # OP_ADD
+    _mul_backward,   # OP_MUL
+    _pow_backward,   # OP_POW
+    _exp_backward,   # OP_EXP
+    _tanh_backward,  # OP_TANH
+    _relu_backward,  # OP_RELU
+    _log_backward,   # OP_LOG
+    _neg_backward,   # OP_NEG
+    _sigmoid_backward,  # OP_SIGMOID
+    _sum_backward,   # OP_SUM
+    _xent_backward,  # OP_XENT
+    _dot_backward,   # OP_DOT
+    _add_const_backward,  # OP_ADD_CONST
+    _mul_const_backward,  # OP_MUL_CONST
+]
+
+
+# -----------------------
+# Topological order
+# -----------------------
+class Topo(list):
+    """
+    Topological order returned by Value.topo() (a plain list of nodes).
+
+    Also carries the graph flattened for the array kernel (_arrays), built on
+    the first USE_NUMBA backward and reused by later ones. Like the order
+    itself, this is only valid for repeated backward passes over one
+    unchanged forward (e.g. benchmarks), not across optimizer steps.
+    """
+    __slots__ = ("_arrays",)
+
+    def __init__(self, nodes=()):
+        super().__init__(nodes)
+        self._arrays = None
+
+
+def _topo_order(root):
+    """
+    Post-order DFS over `_prev` (parents before children, root last).
+
+    Uses an explicit stack of (node, parent iterator) instead of recursion, so
+    deep graphs (long chains of ops) don't hit the recursion limit.
+    """
+    topo = []
+    # nodes are hashed by identity (no __hash__/__eq__ overrides), which is
+    # cheaper than calling id() on every visit
+    visited = {root}
+    stack = [(root, iter(root._prev))]
+    while stack:
+        node, parents = stack[-1]
+        for child in parents:
+            if child not in visited:
+                visited.add(child)
+                stack.append((child, iter(child._prev)))
+                break
+        else:
+            # all parents emitted: node is finished
+            stack.pop()
+            topo.append(node)
+    return topo
+
+
+# -----------------------
+# Flattened backward (struct-of-arrays + Numba)
+# -----------------------
+def _run_backward(op_codes, parent_ptr, parents, const, data, grad):
+    """
+    Reverse sweep over a topologically sorted graph stored as parallel arrays.
+
+    Node i's parents are parents[parent_ptr[i]:parent_ptr[i + 1]] (CSR layout,
+    so n-ary ops fit), its value is data[i] and const[i] holds the op
+    constant (see Value._const). Gradients accumulate in grad.
+    """
+    for i in range(op_codes.shape[0] - 1, -1, -1):
+        op = op_codes[i]
+        if op == OP_LEAF:
+            continue
+        g = grad[i]
+        start = parent_ptr[i]
+        a = parents[start]
+        if op == OP_ADD:
+            grad[a] += g
+            grad[parents[start + 1]] += g
+        elif op == OP_MUL:
+            b = parents[start + 1]
+            grad[a] += data[b] * g
+            grad[b] += data[a] * g
+        elif op == OP_POW:
+            e = const[i]
+            if not (data[a] == 0.0 and e - 1.0 < 0.0):
+                grad[a] += e * data[a] ** (e - 1.0) * g
+        elif op == OP_EXP:
+            grad[a] += data[i] * g
+        elif op == OP_TANH:
+            grad[a] += (1.0 - data[i] * data[i]) * g
+        elif op == OP_RELU:
+            if data[a] > 0.0:
+                grad[a] += g
+        elif op == OP_LOG:
+            grad[a] += g / (data[a] if data[a] > EPS else EPS)
+        elif op == OP_NEG:
+            grad[a] -= g
+        elif op == OP_SIGMOID:
+            grad[a] += data[i] * (1.0 - data[i]) * g
+        elif op == OP_SUM:
+            for k in range(start, parent_ptr[i + 1]):
+                grad[parents[k]] += g
+        elif op == OP_XENT:
+            end = parent_ptr[i + 1]
+            m = data[a]
+            for k in range(start + 1, end):
+                m = max(m, data[parents[k]])
+            total = 0.0
+            for k in range(start, end):
+                total += math.exp(data[parents[k]] - m)
+            for k in range(start, end):
+                grad[parents[k]] += math.exp(data[parents[k]] - m) / total * g
+            grad[parents[start + int(const[i])]] -= g
+        elif op == OP_DOT:
+            n = int(const[i])
+            for k in range(start, start + n):
+                w = parents[k]
+                x = parents[k + n]
+                grad[w] += data[x] * g
+                grad[x] += data[w] * g
+            if parent_ptr[i + 1] - start > 2 * n:
+                grad[parents[start + 2 * n]] += g
+        elif op == OP_ADD_CONST:
+            grad[a] += g
+        elif op == OP_MUL_CONST:
+            grad[a] += const[i] * g
+
+
+_kernel = None
+_kernel_loaded = False
+
+def _numba_kernel():
+    """_run_backward compiled with numba (imported here, on first use), or None without numba."""
+    global _kernel, _kernel_loaded
+    if not _kernel_loaded:
+        _kernel_loaded = True
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; Value.backward falls back to the Python dispatch
+            return None
+        # cache=True keeps the compiled kernel on disk, so only the very first run pays for compilation
+        _kernel = njit(cache=True)(_run_backward)
+    return _kernel
+
+
+_data = attrgetter('data')
+_op_code = attrgetter('_op_code')
+_const = attrgetter('_const')
+
+def _flatten(topo: List[ValueFast]):
+    """(op_codes, parent_ptr, parents, const) arrays describing `topo`'s structure."""
+    index = {v: i for i, v in enumerate(topo)}
+    parent_ptr: List[int] = [0]
+    parents: List[int] = []
+    for v in topo:
+        parents.extend([index[p] for p in v._prev])
+        parent_ptr.append(len(parents))
+    n = len(topo)
+    return (np.fromiter(map(_op_code, topo), dtype=np.int8, count=n),
+            np.array(parent_ptr, dtype=np.int32), np.array(parents, dtype=np.int32),
+            np.fromiter(map(_const, topo), dtype=np.float64, count=n))
+
+def _backward_arrays(topo: List[ValueFast], kernel):
+    """Run `kernel` over `topo` (flattened, or reusing a Topo's arrays) and write .grad back."""
+    arrays = getattr(topo, '_arrays', None)
+    if arrays is None:
+        arrays = _flatten(topo)
+        if isinstance(topo, Topo):
+            topo._arrays = arrays
+    op_codes, parent_ptr, parents, const = arrays
+
+    n = len(topo)
+    grad = np.zeros(n, dtype=np.float64)
+    grad[n - 1] = 1.0  # topo ends with the node backward() was called on
+    # node values are read from the nodes, like the Python rules do (see
+    # backward's topo_cache note: they must still match the forward pass)
+    kernel(op_codes, parent_ptr, parents, const,
+           np.fromiter(map(_data, topo), dtype=np.float64, count=n), grad)
+
+    for v, g in zip(topo, grad.tolist()):
+        v.grad = g
+
+
+# -----------------------
+# Helpers (work with lists of Value)
+# -----------------------
+def tensor_sum(values: Iterable[ValueFast]) -> ValueFast:
+    """
+    Sum of Values as a single n-ary node (OP_SUM).
+
+    One node instead of a chain of len(values) additions: the graph stays
+    shallow and backward is a single loop over the inputs.
+    """
+    vals = tuple(ValueFast._ensure_value(v) for v in values)
+    out = VALUE_CLASS(sum(v.data for v in vals), vals, 'sum')
+    out._op_code = OP_SUM
+    return out
+
+def tensor_mean(values: Iterable[ValueFast]) -> ValueFast:
+    vals = list(values)
+    if len(vals) == 0:
+        return VALUE_CLASS(0.0)
+    return tensor_sum(vals) * (1.0 / len(vals))
+
+
+# -----------------------
+# Tensor: NumPy-backed autograd (one node per array op)
+# -----------------------
+def _unbroadcast(grad: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+    """Sum `grad` down to `shape`, undoing NumPy broadcasting."""
+    while grad.ndim > len(shape):
+        grad = grad.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and grad.shape[axis] != 1:
+            grad = grad.sum(axis=axis, keepdims=True)
+    return grad
+
+
+class Tensor:
+    """
+    Array value with autograd, the vectorized counterpart of Value.
+
+    Attributes:
+      data: np.ndarray (float64)
+      grad: np.ndarray of the same shape, accumulated in place
+      _prev, _op, _backward, label: same meaning as on Value
+
+    Each op creates a single node whose _backward works on whole arrays, so
+    e.g. a Linear layer is one matmul node instead of out*in scalar nodes.
+
+    Usage:
+      W = Tensor(np.ones((2, 3)))
+      x = Tensor([1.0, 2.0, 3.0])
+      y = (W @ x).tanh().sum()
+      y.backward()
+      # now W.grad (2x3) and x.grad (3,) filled
+    """
+    __slots__ = ("data", "grad", "_prev", "_op", "_backward", "label")
+
+    def __init__(self, data, _children: Tuple['Tensor', ...] = (), _op: str = '', label: str = ''):
+        self.data: np.ndarray = np.asarray(data, dtype=np.float64)
+        self.grad: np.ndarray = np.zeros_like(self.data)
+        self._prev: Tuple[Tensor, ...] = _children
+        self._op: str = _op
+        self._backward: Callable[[], None] = lambda: None
+        self.label: str = label
+
+    def __repr__(self):
+        return f"Tensor(shape={self.data.shape}, op={self._op})"
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.data.shape
+
     # -----------------------
     # Utility / conversion
     # -----------------------
     @staticmethod
-    def _ensure_value(other) -> 'Value':
-        return other if isinstance(other, Value) else Value(other)
+    def _ensure_tensor(other) -> 'Tensor':
+        return other if isinstance(other, Tensor) else Tensor(other)
 
-    def detach(self) -> 'Value':
-        """Return a new Value with same numeric data but no history."""
-        return Value(self.data)
+    def detach(self) -> 'Tensor':
+        """Return a new Tensor with a copy of the data but no history."""
+        return Tensor(self.data.copy())
 
-    def __float__(self):
-        return float(self.data)
+    def zero_grad(self):
+        self.grad.fill(0.0)
 
     # -----------------------
     # Arithmetic operators
     # -----------------------
     def __add__(self, other):
-        other = self._ensure_value(other)
-        out = Value(self.data + other.data, (self, other), '+')
+        other = self._ensure_tensor(other)
+        out = Tensor(self.data + other.data, (self, other), '+')
 
         def _backward():
-            # d/dx (x+y) = 1, d/dy (x+y) = 1
-            self.grad += 1.0 * out.grad
-            other.grad += 1.0 * out.grad
+            np.add(self.grad, _unbroadcast(out.grad, self.data.shape), out=self.grad)
+            np.add(other.grad, _unbroadcast(out.grad, other.data.shape), out=other.grad)
         out._backward = _backward
         return out
 
@@ -87,29 +683,28 @@ class Value:
         return self + other
 
     def __neg__(self):
-        out = Value(-self.data, (self,), 'neg')
+        out = Tensor(-self.data, (self,), 'neg')
 
         def _backward():
-            self.grad += -1.0 * out.grad
+            np.subtract(self.grad, out.grad, out=self.grad)
         out._backward = _backward
         return out
 
     def __sub__(self, other):
-        other = self._ensure_value(other)
+        other = self._ensure_tensor(other)
         return self + (-other)
 
     def __rsub__(self, other):
-        other = self._ensure_value(other)
+        other = self._ensure_tensor(other)
         return other - self
 
     def __mul__(self, other):
-        other = self._ensure_value(other)
-        out = Value(self.data * other.data, (self, other), '*')
+        other = self._ensure_tensor(other)
+        out = Tensor(self.data * other.data, (self, other), '*')
 
         def _backward():
-            # d/dx (x*y) = y, d/dy (x*y) = x
-            self.grad += other.data * out.grad
-            other.grad += self.data * out.grad
+            np.add(self.grad, _unbroadcast(other.data * out.grad, self.data.shape), out=self.grad)
+            np.add(other.grad, _unbroadcast(self.data * out.grad, other.data.shape), out=other.grad)
         out._backward = _backward
         return out
 
@@ -117,26 +712,46 @@ class Value:
         return self * other
 
     def __truediv__(self, other):
-        other = self._ensure_value(other)
-        # x / y = x * y^{-1}
+        other = self._ensure_tensor(other)
         return self * (other ** -1)
 
     def __rtruediv__(self, other):
-        other = self._ensure_value(other)
+        other = self._ensure_tensor(other)
         return other / self
 
     def __pow__(self, exponent):
         assert isinstance(exponent, (int, float)), "Only constant powers supported for simplicity"
-        out = Value(self.data ** exponent, (self,), f'**{exponent}')
+        out = Tensor(self.data ** exponent, (self,), f'**{exponent}')
 
         def _backward():
-            # handle zero/near-zero numerics gracefully
-            if self.data == 0.0 and exponent - 1 < 0:
-                # avoid infinite gradient for 0 ** negative
-                grad_local = 0.0
-            else:
+            # same 0 ** negative guard as Value.__pow__
+            with np.errstate(divide='ignore', invalid='ignore'):
                 grad_local = exponent * (self.data ** (exponent - 1))
-            self.grad += grad_local * out.grad
+            if exponent - 1 < 0:
+                grad_local = np.where(self.data == 0.0, 0.0, grad_local)
+            np.add(self.grad, grad_local * out.grad, out=self.grad)
+        out._backward = _backward
+        return out
+
+    def __matmul__(self, other):
+        # supports (n, k) @ (k,), (n, k) @ (k, m) and (k,) @ (k,)
+        other = self._ensure_tensor(other)
+        if (self.data.ndim, other.data.ndim) not in ((2, 1), (2, 2), (1, 1)):
+            raise ValueError(f"Tensor @ supports 2-D @ 1-D/2-D and 1-D @ 1-D, got {self.data.ndim}-D @ {other.data.ndim}-D")
+        out = Tensor(self.data @ other.data, (self, other), '@')
+
+        def _backward():
+            # MatMulBackward: dW = g x^T, dx = W^T g
+            if self.data.ndim == 1:
+                # dot product: out.grad is 0-d
+                np.add(self.grad, out.grad * other.data, out=self.grad)
+                np.add(other.grad, out.grad * self.data, out=other.grad)
+                return
+            if other.data.ndim == 1:
+                np.add(self.grad, np.outer(out.grad, other.data), out=self.grad)
+            else:
+                np.add(self.grad, out.grad @ other.data.T, out=self.grad)
+            np.add(other.grad, self.data.T @ out.grad, out=other.grad)
         out._backward = _backward
         return out
 
@@ -144,95 +759,83 @@ class Value:
     # Elementary math
     # -----------------------
     def exp(self):
-        out_data = math.exp(self.data)
-        out = Value(out_data, (self,), 'exp')
+        out_data = np.exp(self.data)
+        out = Tensor(out_data, (self,), 'exp')
 
         def _backward():
-            # derivative of e^x is e^x
-            self.grad += out_data * out.grad
+            np.add(self.grad, out_data * out.grad, out=self.grad)
         out._backward = _backward
         return out
 
     def log(self):
-        # natural log with epsilon guard
-        safe = self.data if self.data > EPS else EPS
-        out = Value(math.log(safe), (self,), 'log')
+        safe = np.maximum(self.data, EPS)
+        out = Tensor(np.log(safe), (self,), 'log')
 
         def _backward():
-            self.grad += (1.0 / safe) * out.grad
+            np.add(self.grad, out.grad / safe, out=self.grad)
         out._backward = _backward
         return out
 
     def tanh(self):
-        t = math.tanh(self.data)
-        out = Value(t, (self,), 'tanh')
+        t = np.tanh(self.data)
+        out = Tensor(t, (self,), 'tanh')
 
         def _backward():
-            self.grad += (1.0 - t * t) * out.grad
+            np.add(self.grad, (1.0 - t * t) * out.grad, out=self.grad)
         out._backward = _backward
         return out
 
     def relu(self):
-        out_data = self.data if self.data > 0 else 0.0
-        out = Value(out_data, (self,), 'relu')
+        mask = self.data > 0
+        out = Tensor(np.where(mask, self.data, 0.0), (self,), 'relu')
 
         def _backward():
-            self.grad += (1.0 if self.data > 0 else 0.0) * out.grad
+            np.add(self.grad, mask * out.grad, out=self.grad)
         out._backward = _backward
         return out
 
     def sigmoid(self):
-        # implemented via composition for correctness (and automatic gradients)
-        out = 1.0 / (1.0 + (-self).exp())
-        out._op = 'sigmoid'
+        s = 1.0 / (1.0 + np.exp(-self.data))
+        out = Tensor(s, (self,), 'sigmoid')
+
+        def _backward():
+            np.add(self.grad, s * (1.0 - s) * out.grad, out=self.grad)
+        out._backward = _backward
+        return out
+
+    # -----------------------
+    # Reductions
+    # -----------------------
+    def sum(self):
+        out = Tensor(self.data.sum(), (self,), 'sum')
+
+        def _backward():
+            np.add(self.grad, out.grad, out=self.grad)
+        out._backward = _backward
         return out
 
+    def mean(self):
+        return self.sum() * (1.0 / max(self.data.size, 1))
+
     # -----------------------
     # Backpropagation
     # -----------------------
     def backward(self):
         """
-        Run reverse-mode autodiff.
+        Run reverse-mode autodiff (same scheme as Value.backward).
 
-        Builds topological order of the graph (DFS) then runs _backward in reverse.
-        After this call, every node's .grad contains d(self)/d(node) where self is the
-        original Value this method was called on.
+        The output gradient is seeded with ones, so for a non-scalar Tensor
+        this computes the gradient of self.sum().
         """
-        topo: List[Value] = []
-        visited: Set[Value] = set()
+        topo = _topo_order(self)
 
-        def build(v: Value):
-            if v not in visited:
-                visited.add(v)
-                for child in v._prev:
-                    build(child)
-                topo.append(v)
-
-        build(self)
-
-        # zero grads first (avoids accidental accumulation)
         for node in topo:
-            node.grad = 0.0
-        self.grad = 1.0
+            node.grad.fill(0.0)
+        self.grad.fill(1.0)
 
         for node in reversed(topo):
             node._backward()
 
-# -----------------------
-# Helpers (work with lists of Value)
-# -----------------------
-def tensor_sum(values: Iterable[Value]) -> Value:
-    s = Value(0.0)
-    for v in values:
-        s = s + v
-    return s
-
-def tensor_mean(values: Iterable[Value]) -> Value:
-    vals = list(values)
-    if len(vals) == 0:
-        return Value(0.0)
-    return tensor_sum(vals) * (1.0 / len(vals))
-
 
 # -----------------------
 # Example quick test (toy regression)
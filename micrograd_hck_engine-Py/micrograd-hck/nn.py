@@ -5,21 +5,30 @@ Small neural network building blocks that use engine.Value.
 Contents:
 - Parameter: alias of Value intended to be optimized (keeps code semantic)
 - Module: base class for modules (parameters(), zero_grad())
-- Linear: fully-connected layer implemented with scalar Values
+- Linear: fully-connected layer on scalar Values (NumPy forward, one node per output)
 - MLP: sequential MLP (list of Linears + activations)
-- utility activations & stable_softmax
+- TensorLinear / TensorMLP: vectorized counterparts built on engine.Tensor
+- utility activations, stable_softmax (inference) & softmax_cross_entropy (training)
 
 Design notes:
-- This module retains scalar Value operations (no numpy) for pedagogical clarity.
+- Linear/MLP keep scalar Value parameters for pedagogical clarity; Linear's
+  forward is still a single matvec, each output being one fused dot node.
+- TensorLinear/TensorMLP keep each weight matrix in a single Tensor, so a layer
+  is one `W @ x + b` (a single BLAS call and one graph node) instead of out*in
+  scalar nodes; use them for anything larger than a toy.
 - We keep weight initialization sensible (Xavier/He) to help training stability.
 """
 
 from __future__ import annotations
 from typing import List, Callable, Optional, Iterable
+from operator import attrgetter
 import math
-import random
 
-from engine import Value, tensor_sum, tensor_mean
+import numpy as np
+
+from engine import Value, Tensor, OP_DOT, OP_XENT, new_value, tensor_sum, tensor_mean
+
+_data = attrgetter('data')
 
 # Parameter is a semantic alias; we may extend it later (requires_grad etc.)
 Parameter = Value
@@ -28,13 +37,27 @@ Parameter = Value
 # -----------------------
 # Weight initializers
 # -----------------------
-def xavier_uniform(n_in: int, n_out: int) -> List[Parameter]:
+# Samples come from NumPy's global RNG in one vectorized draw (seed with
+# np.random.seed). With `shape` the raw ndarray is returned (Tensor path),
+# otherwise a list of n_in Parameters (one weight row).
+def xavier_uniform(n_in: int, n_out: int, shape: Optional[tuple] = None):
     bound = math.sqrt(6.0 / (n_in + n_out))
-    return [Parameter(random.uniform(-bound, bound)) for _ in range(n_in)]
+    values = np.random.uniform(-bound, bound, size=shape or n_in)
+    return values if shape is not None else [Parameter(v) for v in values.tolist()]
 
-def kaiming_uniform(n_in: int) -> List[Parameter]:
+def kaiming_uniform(n_in: int, shape: Optional[tuple] = None):
     bound = math.sqrt(2.0 / n_in)
-    return [Parameter(random.uniform(-bound, bound)) for _ in range(n_in)]
+    values = np.random.uniform(-bound, bound, size=shape or n_in)
+    return values if shape is not None else [Parameter(v) for v in values.tolist()]
+
+def _init_matrix(initializer: Callable, n_in: int, n_out: int) -> np.ndarray:
+    """(n_out, n_in) initial weights; a single draw for the built-in initializers."""
+    if initializer is xavier_uniform:
+        return xavier_uniform(n_in, n_out, shape=(n_out, n_in))
+    if initializer is kaiming_uniform:
+        return kaiming_uniform(n_in, shape=(n_out, n_in))
+    # custom initializer: called once per row, returns List[Parameter]
+    return np.array([[w.data for w in initializer(n_in)] for _ in range(n_out)], dtype=np.float64)
 
 
 # -----------------------
@@ -47,7 +70,10 @@ class Module:
 
     def zero_grad(self):
         for p in self.parameters():
-            p.grad = 0.0
+            if isinstance(p, Tensor):
+                p.zero_grad()
+            else:
+                p.grad = 0.0
 
 
 # -----------------------
@@ -63,24 +89,41 @@ class Linear(Module):
     def __init__(self, in_features: int, out_features: int, bias: bool = True, initializer: Callable = xavier_uniform):
         self.in_features = in_features
         self.out_features = out_features
-        # initialize per-row (each output neuron has its own weight vector)
-        self.W: List[List[Parameter]] = [
-            initializer(in_features, out_features) if initializer is xavier_uniform else initializer(in_features)
-            for _ in range(out_features)
-        ]
+        # weights[out][in]: built-in initializers draw the whole matrix at once,
+        # custom ones are called per row (each output neuron has its own weight vector)
+        if initializer is xavier_uniform or initializer is kaiming_uniform:
+            self.W: List[List[Parameter]] = [
+                [Parameter(w) for w in row] for row in _init_matrix(initializer, in_features, out_features).tolist()
+            ]
+        else:
+            self.W = [initializer(in_features) for _ in range(out_features)]
         # use zero biases by default
         self.b: Optional[List[Parameter]] = [Parameter(0.0) for _ in range(out_features)] if bias else None
+        # flat weight list (row-major) and per-output parent tuples for the dot nodes
+        self._W_flat: List[Parameter] = [w for row in self.W for w in row]
+        self._rows = [tuple(row) for row in self.W]
+        self._bias = [(bi,) for bi in self.b] if self.b is not None else [()] * out_features
 
     def __call__(self, x: List[Value]) -> List[Value]:
         if len(x) != self.in_features:
             raise ValueError(f"Linear expected input length {self.in_features}, got {len(x)}")
+        # gather current parameter values (the optimizer updates the Values, so
+        # this is read every call rather than cached) and do one matvec
+        n = self.in_features
+        # raw floats become leaf Values (they end up in the dot node's parents)
+        x = tuple(map(Value._ensure_value, x))
+        W = np.fromiter(map(_data, self._W_flat), dtype=np.float64, count=self.out_features * n)
+        x_np = np.fromiter(map(_data, x), dtype=np.float64, count=n)
+        y = W.reshape(self.out_features, n) @ x_np
+        if self.b is not None:
+            y += np.fromiter(map(_data, self.b), dtype=np.float64, count=self.out_features)
         out: List[Value] = []
-        for i in range(self.out_features):
-            # dot product (weights row dot x) + bias
-            s = tensor_sum(w * xi for w, xi in zip(self.W[i], x))
-            if self.b is not None:
-                s = s + self.b[i]
-            out.append(s)
+        for y_i, row, bias in zip(y.tolist(), self._rows, self._bias):
+            # one node for (weights row dot x) + bias; backward in engine._dot_backward
+            v = new_value(y_i, row + x + bias, 'dot')
+            v._op_code = OP_DOT
+            v._const = float(n)
+            out.append(v)
         return out
 
     def parameters(self) -> List[Parameter]:
@@ -139,6 +182,76 @@ class MLP(Module):
         return params
 
 
+# -----------------------
+# Vectorized layers (Tensor-backed)
+# -----------------------
+class TensorLinear(Module):
+    """
+    Linear layer on Tensors: out = W @ x + b
+
+    W is a single Tensor of shape (out_features, in_features), b has shape
+    (out_features,). Same initializers as Linear.
+    """
+    def __init__(self, in_features: int, out_features: int, bias: bool = True, initializer: Callable = xavier_uniform):
+        self.in_features = in_features
+        self.out_features = out_features
+        self.W: Tensor = Tensor(_init_matrix(initializer, in_features, out_features))
+        self.b: Optional[Tensor] = Tensor([0.0] * out_features) if bias else None
+
+    def __call__(self, x: Tensor) -> Tensor:
+        x = Tensor._ensure_tensor(x)
+        # 1-D only: b of shape (out,) would broadcast along a batch axis, not per row
+        if x.data.ndim != 1 or x.data.shape[0] != self.in_features:
+            raise ValueError(f"TensorLinear expected input of shape ({self.in_features},), got {x.data.shape}")
+        out = self.W @ x
+        if self.b is not None:
+            out = out + self.b
+        return out
+
+    def parameters(self) -> List[Tensor]:
+        return [self.W] if self.b is None else [self.W, self.b]
+
+
+class TensorMLP(Module):
+    """
+    Vectorized MLP with the same arguments as MLP; takes and returns a Tensor
+    of shape (in_dim,) -> (out_dim,).
+    """
+    def __init__(self, sizes: List[int], activation: str = 'tanh', final_activation: str = 'linear'):
+        assert len(sizes) >= 2, "sizes must have at least [in, out]"
+        self.layers: List[TensorLinear] = []
+        self.activation = activation
+        self.final_activation = final_activation
+
+        for i in range(len(sizes) - 1):
+            in_f, out_f = sizes[i], sizes[i + 1]
+            init = kaiming_uniform if i < len(sizes) - 2 else xavier_uniform
+            self.layers.append(TensorLinear(in_f, out_f, bias=True, initializer=init))
+
+    def __call__(self, x: Tensor) -> Tensor:
+        out = Tensor._ensure_tensor(x)
+        for idx, layer in enumerate(self.layers):
+            out = layer(out)
+            act = self.final_activation if idx == len(self.layers) - 1 else self.activation
+            if act == 'tanh':
+                out = out.tanh()
+            elif act == 'relu':
+                out = out.relu()
+            elif act == 'sigmoid':
+                out = out.sigmoid()
+            elif act == 'linear':
+                pass
+            else:
+                raise ValueError(f"Unknown activation: {act}")
+        return out
+
+    def parameters(self) -> List[Tensor]:
+        params: List[Tensor] = []
+        for layer in self.layers:
+            params.extend(layer.parameters())
+        return params
+
+
 # -----------------------
 # Softmax (stable) - returns list of probabilities (Value)
 # -----------------------
@@ -147,6 +260,8 @@ def stable_softmax(logits: List[Value]) -> List[Value]:
     Numerically stable softmax:
       softmax(x)_i = exp(x_i - max(x)) / sum_j exp(x_j - max(x))
     Works with Value objects (builds computational graph).
+    Meant for inference; for a training loss use softmax_cross_entropy, which
+    is a single graph node instead of ~3N.
     """
     if not logits:
         return []
@@ -162,6 +277,25 @@ def stable_softmax(logits: List[Value]) -> List[Value]:
     return probs
 
 
+def softmax_cross_entropy(logits: List[Value], target_idx: int) -> Value:
+    """
+    -log(softmax(logits)[target_idx]) as one fused graph node.
+
+    Forward uses the log-sum-exp trick on raw floats:
+      loss = log(sum_j exp(x_j - m)) - (x_t - m),  m = max(x)
+    and backward applies the closed form d loss / d x_i = p_i - [i == t].
+    """
+    if not 0 <= target_idx < len(logits):
+        raise ValueError(f"target_idx {target_idx} out of range for {len(logits)} logits")
+    m = max(v.data for v in logits)
+    s = sum(math.exp(v.data - m) for v in logits)
+    loss = math.log(s) - (logits[target_idx].data - m)
+    out = new_value(loss, tuple(logits), 'xent')
+    out._op_code = OP_XENT
+    out._const = float(target_idx)
+    return out
+
+
 # -----------------------
 # Convenience: convert floats to Value list
 # -----------------------
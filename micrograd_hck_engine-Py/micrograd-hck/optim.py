@@ -6,16 +6,22 @@ Includes:
 - Loss base class, MSELoss, CrossEntropyLoss (simple)
 - Optimizer base class, SGD (momentum optional), Adam (bias-corrected)
 Notes:
-- This is implemented to work with scalar Value parameters (micrograd-style).
-- State is keyed by id(param) to avoid accidental issues with Value hashing.
+- Works with scalar Value parameters (micrograd-style) and Tensor parameters.
+- Optimizer state lives in flat NumPy arrays aligned with a flattened view of
+  all parameters, so an update is a handful of vectorized ops regardless of
+  parameter count (no per-param dict lookups).
 """
 
 from __future__ import annotations
-from typing import List, Dict, Tuple
+from typing import List, Tuple
+
 import math
+import numbers
+
+import numpy as np
 
-from engine import Value, tensor_mean, tensor_sum
-from nn import Parameter, stable_softmax
+from engine import Value, Tensor, tensor_mean, tensor_sum
+from nn import Parameter, softmax_cross_entropy
 
 # -----------------------
 # Losses
@@ -28,24 +34,23 @@ class MSELoss(Loss):
     """Mean squared error: mean((pred - target)^2)"""
     def __call__(self, preds: List[Value], targets: List[float]) -> Value:
         assert len(preds) == len(targets)
-        losses = [(p - Value(t)) ** 2 for p, t in zip(preds, targets)]
+        losses = [(p - t) ** 2 for p, t in zip(preds, targets)]
         return tensor_mean(losses)
 
 class CrossEntropyLoss(Loss):
     """
-    Cross-entropy for logits + one-hot target:
-    - compute softmax of logits (stable_softmax)
-    - return mean(-sum(target_i * log(prob_i)))
-    For simplicity, expect 'targets' as one-hot list or index-based form has to be adapted.
+    Cross-entropy for logits + target:
+    - targets: one-hot list (1.0 for the true class) or a class index
+    - each true class is one fused softmax_cross_entropy node (backward p - t)
+    - return the mean over true classes
     """
-    def __call__(self, logits: List[Value], targets: List[float]) -> Value:
-        # assume targets is list with same length, containing 1.0 for true class else 0.0
-        probs = stable_softmax(logits)
-        losses = []
-        for p, t in zip(probs, targets):
-            if t == 1.0:
-                # -log(p) for the true class
-                losses.append(-(p.log()))
+    def __call__(self, logits: List[Value], targets) -> Value:
+        # numbers.Integral also covers NumPy integer labels (e.g. labels[i])
+        if isinstance(targets, numbers.Integral):
+            return softmax_cross_entropy(logits, targets)
+        losses = [softmax_cross_entropy(logits, i) for i, t in enumerate(targets) if t == 1.0]
+        if len(losses) == 1:
+            return losses[0]
         return tensor_mean(losses)
 
 
@@ -53,76 +58,150 @@ class CrossEntropyLoss(Loss):
 # Optimizer base + implementations
 # -----------------------
 class Optimizer:
+    """
+    Base optimizer.
+
+    Parameters are viewed as one flat float64 vector: scalar Values first
+    (in order), then every Tensor raveled. Values and Tensors are gathered
+    into the flat buffers and the update is scattered back on each step
+    (Tensor.data updated in place), so parameters stay owned by their
+    Tensors and may be shared between optimizers. Subclasses keep their
+    state as arrays of the same length (allocated in _init_state).
+    """
     def __init__(self, params: List[Parameter], lr: float = 1e-3):
-        self.params = list(params)
         self.lr = lr
+        self._index_params(params)
 
     def step(self):
         raise NotImplementedError
 
     def zero_grad(self):
         for p in self.params:
-            p.grad = 0.0
+            if isinstance(p, Tensor):
+                p.zero_grad()
+            else:
+                p.grad = 0.0
 
     def set_parameters(self, params: List[Parameter]):
+        """Replace the optimized parameters; optimizer state starts from zero."""
+        self._index_params(params)
+        self._init_state()
+
+    # -----------------------
+    # Flat parameter view
+    # -----------------------
+    def _index_params(self, params: List[Parameter]):
         self.params = list(params)
+        self._scalars: List[Value] = [p for p in self.params if not isinstance(p, Tensor)]
+        # (tensor, start, end) slices of the flat vector
+        self._tensors: List[Tuple[Tensor, int, int]] = []
+        n = len(self._scalars)
+        for t in self.params:
+            if isinstance(t, Tensor):
+                self._tensors.append((t, n, n + t.data.size))
+                n += t.data.size
+        self._size: int = n
+        self._data: np.ndarray = np.zeros(self._size)
+        self._grad: np.ndarray = np.zeros(self._size)
+
+    def _init_state(self):
+        pass
+
+    def _flat_grad(self) -> np.ndarray:
+        """Flat gradient vector (a reused buffer: don't keep it across steps)."""
+        n = len(self._scalars)
+        self._grad[:n] = np.fromiter((p.grad for p in self._scalars), dtype=np.float64, count=n)
+        for t, start, end in self._tensors:
+            self._grad[start:end] = t.grad.ravel()
+        return self._grad
+
+    def _flat_data(self) -> np.ndarray:
+        """Flat parameter vector (a reused buffer: don't keep it across steps)."""
+        n = len(self._scalars)
+        self._data[:n] = np.fromiter((p.data for p in self._scalars), dtype=np.float64, count=n)
+        for t, start, end in self._tensors:
+            self._data[start:end] = t.data.ravel()
+        return self._data
+
+    def _add_flat(self, delta: np.ndarray):
+        """p.data += delta for every parameter (delta laid out like _flat_grad)."""
+        n = len(self._scalars)
+        for p, d in zip(self._scalars, delta[:n].tolist()):
+            p.data += d
+        for t, start, end in self._tensors:
+            t.data += delta[start:end].reshape(t.data.shape)
 
 
 class SGD(Optimizer):
     """
     SGD with optional momentum and weight_decay.
-    Velocity stored per-param (keyed by id).
+    Velocity stored as one flat array over all params.
     """
     def __init__(self, params: List[Parameter], lr: float = 1e-2, momentum: float = 0.0, weight_decay: float = 0.0):
         super().__init__(params, lr)
         self.momentum = momentum
         self.weight_decay = weight_decay
-        # velocity keyed by id
-        self._vel: Dict[int, float] = {id(p): 0.0 for p in self.params}
+        self._init_state()
+
+    def _init_state(self):
+        self._vel: np.ndarray = np.zeros(self._size)
 
     def step(self):
-        for p in self.params:
-            g = p.grad
-            if self.weight_decay:
-                g = g + self.weight_decay * p.data
-            if self.momentum:
-                v = self._vel.get(id(p), 0.0)
-                v_new = self.momentum * v - self.lr * g
-                self._vel[id(p)] = v_new
-                p.data += v_new
-            else:
-                p.data += -self.lr * g
+        g = self._flat_grad()
+        if self.weight_decay:
+            g = g + self.weight_decay * self._flat_data()
+        if self.momentum:
+            # v = momentum * v - lr * g; p += v
+            self._vel *= self.momentum
+            self._vel -= self.lr * g
+            self._add_flat(self._vel)
+        else:
+            self._add_flat(-self.lr * g)
 
 
 class Adam(Optimizer):
     """
     Adam optimizer (bias-corrected).
-    State per param keyed by id(param): m, v. Time step t is global.
+    State m, v as flat arrays over all params. Time step t is global.
     """
     def __init__(self, params: List[Parameter], lr: float = 1e-3, betas: Tuple[float, float] = (0.9, 0.999), eps: float = 1e-8, weight_decay: float = 0.0):
         super().__init__(params, lr)
         self.beta1, self.beta2 = betas
         self.eps = eps
         self.weight_decay = weight_decay
-        self._m: Dict[int, float] = {id(p): 0.0 for p in self.params}
-        self._v: Dict[int, float] = {id(p): 0.0 for p in self.params}
+        self._init_state()
+
+    def _init_state(self):
+        self._m: np.ndarray = np.zeros(self._size)
+        self._v: np.ndarray = np.zeros(self._size)
+        # the step count restarts with the moments, or bias correction would be off
         self._t: int = 0
+        # beta1**t, beta2**t maintained incrementally (one mul per step)
+        self._b1t: float = 1.0
+        self._b2t: float = 1.0
 
     def step(self):
         self._t += 1
-        for p in self.params:
-            g = p.grad
-            if self.weight_decay:
-                g = g + self.weight_decay * p.data
-            pid = id(p)
-            m = self._m.get(pid, 0.0)
-            v = self._v.get(pid, 0.0)
-            m = self.beta1 * m + (1 - self.beta1) * g
-            v = self.beta2 * v + (1 - self.beta2) * (g * g)
-            self._m[pid] = m
-            self._v[pid] = v
-            # bias correction
-            m_hat = m / (1 - self.beta1 ** self._t)
-            v_hat = v / (1 - self.beta2 ** self._t)
-            step = - self.lr * m_hat / (math.sqrt(v_hat) + self.eps)
-            p.data += step
+        self._b1t *= self.beta1
+        self._b2t *= self.beta2
+        # per-step scalars, hoisted out of the array math
+        bc1 = 1 - self._b1t
+        bc2 = 1 - self._b2t
+        step_size = self.lr / bc1
+        inv_sqrt_bc2 = 1.0 / math.sqrt(bc2)
+
+        g = self._flat_grad()
+        if self.weight_decay:
+            g = g + self.weight_decay * self._flat_data()
+        self._m *= self.beta1
+        self._m += (1 - self.beta1) * g
+        self._v *= self.beta2
+        self._v += (1 - self.beta2) * (g * g)
+        # bias-corrected m_hat / (sqrt(v_hat) + eps), built in one scratch buffer:
+        # m / bc1 / (sqrt(v) / sqrt(bc2) + eps)
+        denom = np.sqrt(self._v)
+        denom *= inv_sqrt_bc2
+        denom += self.eps
+        np.divide(self._m, denom, out=denom)
+        denom *= -step_size
+        self._add_flat(denom)
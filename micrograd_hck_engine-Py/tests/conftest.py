@@ -0,0 +1,6 @@
+"""tests.conftest
+The micrograd-hck modules import each other as top-level modules (from engine import ...).
+"""
+import os, sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'micrograd-hck'))
@@ -0,0 +1,136 @@
+"""tests.test_engine
+Finite-difference checks of each op code's backward rule, run on every
+backward path (USE_NUMBA) and node class (VALUE_CLASS).
+"""
+import importlib.util
+
+import pytest
+
+import engine
+from engine import Value, ValueFast, tensor_sum
+from nn import Linear, softmax_cross_entropy
+
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+BACKWARD_PATHS = [
+    pytest.param(False, id='python'),
+    pytest.param(True, id='numba', marks=pytest.mark.skipif(not HAS_NUMBA, reason='numba not installed')),
+]
+NODE_CLASSES = [
+    pytest.param(Value, id='Value'),
+    pytest.param(ValueFast, id='ValueFast'),
+]
+
+@pytest.fixture(params=BACKWARD_PATHS)
+def backward_path(request, monkeypatch):
+    monkeypatch.setattr(engine, 'USE_NUMBA', request.param)
+    return request.param
+
+@pytest.fixture(params=NODE_CLASSES)
+def mode(request, backward_path, monkeypatch):
+    # node class for op results (engine.VALUE_CLASS) and for the test's leaves
+    monkeypatch.setattr(engine, 'VALUE_CLASS', request.param)
+    return request.param
+
+def check_grads(build, leaves, h=1e-6, tol=1e-5):
+    """Compare backward() grads of build() w.r.t. leaves with central differences."""
+    out = build()
+    out.backward()
+    analytic = [v.grad for v in leaves]
+    for v, g in zip(leaves, analytic):
+        x0 = v.data
+        v.data = x0 + h
+        up = build().data
+        v.data = x0 - h
+        down = build().data
+        v.data = x0
+        assert abs(g - (up - down) / (2 * h)) <= tol * max(1.0, abs(g))
+
+# (op code of the node under test, leaf values, op); the node is fed into tanh
+# so its upstream gradient isn't 1
+CASES = {
+    'add': (engine.OP_ADD, [0.7, -1.3], lambda x, y: x + y),
+    'sub': (engine.OP_ADD, [0.7, -1.3], lambda x, y: x - y),
+    'mul': (engine.OP_MUL, [0.7, -1.3], lambda x, y: x * y),
+    'mul_same': (engine.OP_MUL, [0.7], lambda x: x * x),
+    'div': (engine.OP_MUL, [0.7, -1.3], lambda x, y: x / y),
+    'pow': (engine.OP_POW, [1.7], lambda x: x ** -1.5),
+    'exp': (engine.OP_EXP, [0.3], lambda x: x.exp()),
+    'tanh': (engine.OP_TANH, [0.4], lambda x: x.tanh()),
+    'relu': (engine.OP_RELU, [0.8], lambda x: x.relu()),
+    'log': (engine.OP_LOG, [2.5], lambda x: x.log()),
+    'neg': (engine.OP_NEG, [0.9], lambda x: -x),
+    'sigmoid': (engine.OP_SIGMOID, [-0.6], lambda x: x.sigmoid()),
+    'sum': (engine.OP_SUM, [0.2, -0.5, 0.9], lambda *xs: tensor_sum(xs)),
+    'xent': (engine.OP_XENT, [0.2, -1.0, 1.5], lambda *xs: softmax_cross_entropy(list(xs), 1)),
+    'add_const': (engine.OP_ADD_CONST, [0.5], lambda x: x + 2),
+    'radd_const': (engine.OP_ADD_CONST, [0.5], lambda x: 2 + x),
+    'sub_const': (engine.OP_ADD_CONST, [0.5], lambda x: x - 3),
+    'rsub_const': (engine.OP_ADD_CONST, [0.5], lambda x: 3 - x),
+    'mul_const': (engine.OP_MUL_CONST, [0.5], lambda x: x * 2.5),
+    'rmul_const': (engine.OP_MUL_CONST, [0.5], lambda x: 2.5 * x),
+    'div_const': (engine.OP_MUL_CONST, [0.5], lambda x: x / 4),
+    'rdiv_const': (engine.OP_MUL_CONST, [0.5], lambda x: 4 / x),
+}
+
+def test_cases_cover_every_op_code():
+    codes = {v for k, v in vars(engine).items() if k.startswith('OP_') and k != 'OP_LEAF'}
+    covered = {op for op, _, _ in CASES.values()} | {engine.OP_DOT}  # dot: see test_dot_grads
+    assert covered == codes
+    assert len(engine._BACKWARDS) == len(codes)
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_op_grads(name, mode):
+    op_code, inputs, fn = CASES[name]
+    leaves = [mode(v) for v in inputs]
+    node = fn(*leaves)
+    assert node._op_code == op_code
+    assert type(node) is mode
+    check_grads(lambda: fn(*leaves).tanh(), leaves)
+
+@pytest.mark.parametrize('bias', [True, False])
+def test_dot_grads(bias, mode):
+    layer = Linear(3, 2, bias=bias)
+    x = [mode(v) for v in [0.3, -0.8, 1.1]]
+    y = layer(x)
+    assert all(v._op_code == engine.OP_DOT for v in y)
+    check_grads(lambda: (lambda y: y[0] * y[1])(layer(x)), x + layer.parameters())
+
+@pytest.mark.skipif(not HAS_NUMBA, reason='numba not installed')
+def test_python_and_numba_paths_agree(monkeypatch):
+    a, b, c = leaves = [Value(v) for v in [0.4, -0.7, 1.2]]
+    out = ((a * b + c).tanh() * (b / c).exp() - (a * a).relu()) ** 2
+    grads = []
+    for use_numba in [False, True]:
+        monkeypatch.setattr(engine, 'USE_NUMBA', use_numba)
+        out.backward()
+        grads.append([v.grad for v in leaves])
+    assert grads[0] == pytest.approx(grads[1])
+
+def test_deep_chain_no_recursion_limit(mode):
+    x = mode(0.1)
+    y = x
+    for _ in range(5000):
+        y = y * 1.0 + 0.0
+    y.backward()
+    assert x.grad == pytest.approx(1.0)
+
+def test_value_fast_has_no_debug_fields():
+    v = ValueFast(1.0)
+    assert not hasattr(v, '__dict__')
+    assert not hasattr(v, 'label')
+    assert Value(1.0, label='x').label == 'x'
+
+def test_topo_cache_reuse(mode):
+    x, y = mode(0.5), mode(-1.5)
+    out = ((x * y + x).tanh() * 3).exp()
+    out.backward()
+    expected = (x.grad, y.grad)
+    topo = out.topo()
+    for _ in range(2):
+        out.backward(topo_cache=topo)
+        assert (x.grad, y.grad) == pytest.approx(expected)
+    if engine.USE_NUMBA:
+        assert topo._arrays is not None
+    with pytest.raises(ValueError):
+        (x * y).backward(topo_cache=topo)
@@ -0,0 +1,25 @@
+"""tests.test_nn
+"""
+import numpy as np
+import pytest
+
+from engine import Tensor
+from nn import MLP, TensorLinear, Linear
+
+def test_mlp_accepts_raw_floats():
+    y = MLP([2, 3, 1])([0.5, 1.0])
+    y[0].backward()
+    assert len(y) == 1
+
+def test_tensor_linear_matches_linear():
+    np.random.seed(0)
+    layer = Linear(3, 2)
+    t = TensorLinear(3, 2)
+    t.W.data[...] = [[w.data for w in row] for row in layer.W]
+    x = [0.3, -0.8, 1.1]
+    assert np.allclose([v.data for v in layer(x)], t(Tensor(x)).data)
+
+def test_tensor_linear_rejects_batched_input():
+    layer = TensorLinear(3, 2)
+    with pytest.raises(ValueError):
+        layer(Tensor(np.ones((3, 2))))
@@ -0,0 +1,123 @@
+"""tests.test_optim
+Optimizer updates against straightforward per-parameter reference loops.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from engine import Value, Tensor
+from optim import SGD, Adam, CrossEntropyLoss, MSELoss
+
+def make_params():
+    # scalar Values and Tensors mixed, so both halves of the flat vector are used
+    return [Value(0.5), Tensor([[1.0, -2.0], [0.25, 3.0]]), Value(-1.5), Tensor([0.1, -0.4])]
+
+def flat(params):
+    return np.concatenate([np.ravel(p.data) for p in params])
+
+def set_grads(params):
+    # grad of sum((p - 1)^2), written by hand
+    for p in params:
+        if isinstance(p, Tensor):
+            p.grad[...] = 2 * (p.data - 1)
+        else:
+            p.grad = 2 * (p.data - 1)
+
+def sgd_reference(values, steps, lr, momentum, weight_decay):
+    values = list(values)
+    vel = [0.0] * len(values)
+    for _ in range(steps):
+        for i, p in enumerate(values):
+            g = 2 * (p - 1) + weight_decay * p
+            vel[i] = momentum * vel[i] - lr * g
+            values[i] = p + (vel[i] if momentum else -lr * g)
+    return values
+
+@pytest.mark.parametrize('momentum, weight_decay', [(0.0, 0.0), (0.9, 0.0), (0.9, 0.01)])
+def test_sgd_matches_reference(momentum, weight_decay):
+    params = make_params()
+    expected = sgd_reference(flat(params).tolist(), 5, 0.1, momentum, weight_decay)
+    opt = SGD(params, lr=0.1, momentum=momentum, weight_decay=weight_decay)
+    for _ in range(5):
+        set_grads(params)
+        opt.step()
+    assert np.allclose(flat(params), expected)
+
+def adam_reference(values, steps, lr, beta1, beta2, eps, weight_decay):
+    values = list(values)
+    m = [0.0] * len(values)
+    v = [0.0] * len(values)
+    for t in range(1, steps + 1):
+        for i, p in enumerate(values):
+            g = 2 * (p - 1) + weight_decay * p
+            m[i] = beta1 * m[i] + (1 - beta1) * g
+            v[i] = beta2 * v[i] + (1 - beta2) * g * g
+            m_hat = m[i] / (1 - beta1 ** t)
+            v_hat = v[i] / (1 - beta2 ** t)
+            values[i] = p - lr * m_hat / (math.sqrt(v_hat) + eps)
+    return values
+
+@pytest.mark.parametrize('weight_decay', [0.0, 0.01])
+def test_adam_matches_reference(weight_decay):
+    params = make_params()
+    # enough steps that a wrong beta**t (bias correction) would show
+    expected = adam_reference(flat(params).tolist(), 20, 0.05, 0.9, 0.999, 1e-8, weight_decay)
+    opt = Adam(params, lr=0.05, weight_decay=weight_decay)
+    for _ in range(20):
+        set_grads(params)
+        opt.step()
+    assert np.allclose(flat(params), expected)
+
+def test_tensor_shared_between_optimizers():
+    arr = np.array([1.0, 2.0])
+    w = Tensor(arr)
+    first = SGD([w], lr=1.0)
+    SGD([w], lr=1.0)
+    w.grad[...] = 1.0
+    first.step()
+    assert np.allclose(w.data, [0.0, 1.0])
+    assert np.shares_memory(w.data, arr)
+
+def test_set_parameters_resets_adam_state():
+    used = make_params()
+    opt = Adam(used, lr=0.1)
+    for _ in range(3):
+        set_grads(used)
+        opt.step()
+    params, fresh_params = make_params(), make_params()
+    opt.set_parameters(params)
+    fresh = Adam(fresh_params, lr=0.1)
+    for _ in range(2):
+        set_grads(params)
+        opt.step()
+        set_grads(fresh_params)
+        fresh.step()
+    assert np.allclose(flat(params), flat(fresh_params))
+
+def log_softmax_reference(logits, i):
+    m = max(logits)
+    return logits[i] - m - math.log(sum(math.exp(z - m) for z in logits))
+
+@pytest.mark.parametrize('target', [1, np.int64(1), [0.0, 1.0, 0.0]])
+def test_cross_entropy_targets(target):
+    logits = [Value(v) for v in [0.2, -1.0, 1.5]]
+    loss = CrossEntropyLoss()(logits, target)
+    assert loss.data == pytest.approx(-log_softmax_reference([0.2, -1.0, 1.5], 1))
+    loss.backward()
+    exps = [math.exp(v) for v in [0.2, -1.0, 1.5]]
+    expected = [e / sum(exps) - (i == 1) for i, e in enumerate(exps)]
+    assert np.allclose([v.grad for v in logits], expected)
+
+def test_cross_entropy_multi_hot_is_mean():
+    values = [0.2, -1.0, 1.5]
+    loss = CrossEntropyLoss()([Value(v) for v in values], [1.0, 0.0, 1.0])
+    expected = -(log_softmax_reference(values, 0) + log_softmax_reference(values, 2)) / 2
+    assert loss.data == pytest.approx(expected)
+
+def test_mse_loss_with_float_targets():
+    preds = [Value(0.5), Value(-1.0)]
+    loss = MSELoss()(preds, [1.0, 1.0])
+    assert loss.data == pytest.approx((0.25 + 4.0) / 2)
+    loss.backward()
+    assert [p.grad for p in preds] == pytest.approx([-0.5, -2.0])
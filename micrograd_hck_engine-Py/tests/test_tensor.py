@@ -0,0 +1,65 @@
+"""tests.test_tensor
+Finite-difference checks of Tensor ops (gradient of out.sum(), as backward seeds ones).
+"""
+import numpy as np
+import pytest
+
+from engine import Tensor
+
+def check_tensor_grads(build, leaves, h=1e-6, tol=1e-5):
+    """Compare backward() grads of build() (a 0-d Tensor) with central differences per element."""
+    build().backward()
+    for t in leaves:
+        analytic = t.grad.copy()
+        numeric = np.zeros_like(t.data)
+        for idx in np.ndindex(t.data.shape):
+            x0 = t.data[idx]
+            t.data[idx] = x0 + h
+            up = float(build().data)
+            t.data[idx] = x0 - h
+            down = float(build().data)
+            t.data[idx] = x0
+            numeric[idx] = (up - down) / (2 * h)
+        assert np.allclose(analytic, numeric, atol=tol)
+
+A = [[0.5, -1.2, 0.3], [1.1, 0.4, -0.7]]  # (2, 3)
+B = [[0.9, 1.5, 0.6], [0.2, 1.3, 0.8]]    # (2, 3), positive
+ROW = [0.25, -0.5, 1.5]                    # (3,), broadcasts over A's rows
+COL3x2 = [[0.3, -0.1], [0.7, 0.2], [-0.4, 0.6]]
+
+# (leaf arrays, op); results go through tanh().sum() so upstream gradients vary
+CASES = {
+    'add_broadcast': ([A, ROW], lambda a, b: a + b),
+    'sub_broadcast': ([A, ROW], lambda a, b: a - b),
+    'mul_broadcast': ([A, ROW], lambda a, b: a * b),
+    'div': ([A, B], lambda a, b: a / b),
+    'radd_rsub_rmul': ([A], lambda a: 2 - (1 + a) * 0.5),
+    'pow': ([B], lambda b: b ** -1.5),
+    'matvec': ([A, ROW], lambda a, x: a @ x),
+    'matmul': ([A, COL3x2], lambda a, b: a @ b),
+    'vecdot': ([ROW, [1.0, 2.0, -0.5]], lambda x, y: x @ y),
+    'exp': ([A], lambda a: a.exp()),
+    'log': ([B], lambda b: b.log()),
+    'tanh': ([A], lambda a: a.tanh()),
+    'relu': ([A], lambda a: a.relu()),
+    'sigmoid': ([A], lambda a: a.sigmoid()),
+    'neg': ([A], lambda a: -a),
+    'mean': ([A], lambda a: a.mean() * a),
+}
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_tensor_op_grads(name):
+    arrays, fn = CASES[name]
+    leaves = [Tensor(np.array(a, dtype=np.float64)) for a in arrays]
+    check_tensor_grads(lambda: fn(*leaves).tanh().sum(), leaves)
+
+def test_matmul_rejects_unsupported_ranks():
+    with pytest.raises(ValueError):
+        Tensor(np.ones((2, 2, 2))) @ Tensor(np.ones(2))
+
+def test_backward_resets_grads():
+    a = Tensor([1.0, 2.0])
+    out = (a * a).sum()
+    out.backward()
+    out.backward()
+    assert np.allclose(a.grad, [2.0, 4.0])